@@ -1,10 +1,50 @@
 import math
+import time
+import functools
+import threading
+import contextlib
 from enum import Enum
-from typing import Union, Collection, cast
+from typing import List, Union, Optional, Collection, cast
 from dataclasses import dataclass
 
 import pyvisa
 
+from ialib.interfaces.visa_rm import get_resource_manager
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional; waveform formatting falls back to pure Python
+    np = None  # type: ignore
+
+# Fixed commands pre-encoded (terminator included) so write_raw skips
+# the per-call string build + encode
+_CMD_SHUTDOWN = b"SYST:SHUTDOWN\n"
+_CMD_RESTART = b"SYST:RESTART\n"
+_CMD_ALIGN_PHASE = b"PHAS:INIT\n"
+_CMD_RESET = b"*RST\n"
+_CMD_BEEP = b"SYST:BEEP\n"
+_CMD_CSC_TO_CH1 = b"SYST:CSC CH2,CH1\n"
+_CMD_CSC_TO_CH2 = b"SYST:CSC CH1,CH2\n"
+_CMD_CWC_TO_CH1 = b"SYST:CWC CH2,CH1\n"
+_CMD_CWC_TO_CH2 = b"SYST:CWC CH1,CH2\n"
+
+# Symbolic impedance replies mapped by their 3-char prefix
+_IMP_NAMES = {"MIN": 0.0, "MAX": 10001.0, "INF": math.inf}
+_isinf = math.isinf
+
+
+def _join_rooted(cmds: Collection[str]) -> str:
+    """
+    Join commands with ";", rooting each path-relative header with ":".
+
+    IEEE 488.2 resolves later headers in a compound message relative to
+    the previous one, so "SOUR1:APPL:RAMP;SOUR1:FREQ 1" fails on strict
+    parsers. An explicit leading ":" (skipped for *-common commands)
+    anchors every segment at the root.
+    """
+    return ";".join(c if c.startswith((":", "*")) else f":{c}" for c in cmds)
+
 
 class RigolDG4000:
     """
@@ -21,13 +61,24 @@ class RigolDG4000:
     VERY loosely from  https://github.com/nanoelectronics-new/qcodes/blob/master/instrument_drivers/rigol/DG4000.py
     """
 
-    def __init__(self, address: str) -> None:
+    def __init__(self, address: str, cache_ttl: float = 0.0) -> None:
+        """
+        :param address: VISA resource address
+        :param cache_ttl: Optional seconds to serve repeated queries from a
+            cache; 0 (the default) disables caching entirely
+        """
         self.ins_handle = cast(
             pyvisa.resources.MessageBasedResource,
-            pyvisa.ResourceManager().open_resource(address),
+            get_resource_manager().open_resource(address),
         )
-        self.chan_1 = self.Channel(self, 1)
-        self.chan_2 = self.Channel(self, 2)
+        self.cache_ttl = cache_ttl
+        self._cache: dict = {}
+        self._cache_enabled = True
+        self._lock = threading.Lock()
+        self._wbuf: Optional[List[str]] = None
+        self._wbuf_len = 0
+        self.chan_1 = _make_channel_class(1)(self)
+        self.chan_2 = _make_channel_class(2)(self)
 
         self.model = self.get_idn().model
 
@@ -45,8 +96,129 @@ class RigolDG4000:
         else:
             raise KeyError(f"Model {self.model} is not recognized")
 
-    on_off_lut = {True: "ON", False: "OFF"}
-    on_off_inv = {v: k for k, v in on_off_lut.items()}
+    # Whether the transport accepts ;-joined compound messages
+    supports_batching = True
+
+    # Flush a pipeline block once this many buffered bytes accumulate
+    _PIPELINE_LIMIT = 1024
+
+    # Destructive reads: these pop instrument state, so a cached reply
+    # would silently swallow queue entries
+    _NEVER_CACHE = frozenset({"SYST:ERR?"})
+
+    def _flush_locked(self) -> None:
+        """Ship buffered writes as one compound message; caller holds _lock."""
+        if self._wbuf:
+            if self._cache:
+                self._cache.clear()
+            self.ins_handle.write(_join_rooted(self._wbuf))
+            self._wbuf.clear()
+            self._wbuf_len = 0
+
+    def _write(self, cmd: str) -> None:
+        with self._lock:
+            if self._wbuf is not None:
+                self._wbuf.append(cmd)
+                self._wbuf_len += len(cmd) + 1
+                if self._wbuf_len > self._PIPELINE_LIMIT:
+                    self._flush_locked()
+                return
+            # Any write can change instrument state, so cached replies go stale
+            if self._cache:
+                self._cache.clear()
+            self.ins_handle.write(cmd)
+
+    def _write_raw(self, cmd: bytes) -> None:
+        """Bytes fast path for the pre-encoded fixed commands."""
+        with self._lock:
+            # Raw commands must land after anything buffered before them
+            self._flush_locked()
+            if self._cache:
+                self._cache.clear()
+            raw = getattr(self.ins_handle, "write_raw", None)
+            if raw is not None:
+                raw(cmd)
+            else:
+                self.ins_handle.write(cmd.decode("ascii").rstrip("\n"))
+
+    def _query(self, cmd: str) -> str:
+        with self._lock:
+            # The reply must reflect any writes still sitting in the buffer
+            self._flush_locked()
+            if (
+                self.cache_ttl > 0
+                and self._cache_enabled
+                and cmd not in self._NEVER_CACHE
+            ):
+                hit = self._cache.get(cmd)
+                now = time.monotonic()
+                if hit is not None and now - hit[0] < self.cache_ttl:
+                    return hit[1]
+                res = self.ins_handle.query(cmd)
+                self._cache[cmd] = (now, res)
+                return res
+            return self.ins_handle.query(cmd)
+
+    @contextlib.contextmanager
+    def pipeline(self):
+        """
+        Buffer writes inside the block and ship them as compound messages.
+
+        Writes coalesce with ";" and flush when a query needs their
+        effects, when roughly 1 KiB has accumulated, or at block exit —
+        flush-on-read pipelining. Opt-in, because unconditional deferral
+        would hold commands indefinitely in write-only scripts.
+        """
+        with self._lock:
+            self._wbuf = []
+            self._wbuf_len = 0
+        try:
+            yield self
+        finally:
+            with self._lock:
+                try:
+                    self._flush_locked()
+                finally:
+                    self._wbuf = None
+                    self._wbuf_len = 0
+
+    def _qf(self, cmd: str) -> float:
+        """Query a float reply; float() itself handles the whitespace."""
+        return float(self._query(cmd))
+
+    def _qb(self, cmd: str) -> bool:
+        """Query an ON/OFF reply."""
+        return self._query(cmd).strip() == "ON"
+
+    def _qe(self, cmd: str, enum: type) -> "Enum":
+        """Query a reply that names an enum member."""
+        return enum(self._query(cmd).strip())
+
+    @contextlib.contextmanager
+    def no_cache(self):
+        """Force live queries inside the block, e.g. while watching a sweep."""
+        self._cache_enabled = False
+        try:
+            yield self
+        finally:
+            self._cache_enabled = True
+
+    def batch_write(self, cmds: List[str]) -> None:
+        """
+        Write several SCPI commands as one transaction.
+
+        Joining with ";" ships the whole batch in a single message — one
+        transport round-trip instead of one per command. Set
+        supports_batching False to fall back to per-command writes.
+
+        :param cmds: SCPI command strings, in execution order
+        :return: None
+        """
+        if self.supports_batching:
+            self._write(_join_rooted(cmds))
+        else:
+            for cmd in cmds:
+                self._write(cmd)
 
     def get_idn(self) -> "RigolDG4000.IDNData":
         """
@@ -54,7 +226,7 @@ class RigolDG4000:
 
         :return: IDN string
         """
-        res = tuple(i.strip() for i in self.ins_handle.query("*IDN?").split(","))
+        res = tuple(i.strip() for i in self._query("*IDN?").split(","))
         if len(res) != 4:
             raise ValueError(
                 f"Invalid IDN response, got '{res}', expected '<vendor>,<model>,<serial>,<firmware>'"
@@ -67,7 +239,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:SHUTDOWN")
+        self._write_raw(_CMD_SHUTDOWN)
 
     def restart(self) -> None:
         """
@@ -75,7 +247,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:RESTART")
+        self._write_raw(_CMD_RESTART)
 
     def align_phase(self) -> None:
         """
@@ -83,7 +255,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("PHAS:INIT")
+        self._write_raw(_CMD_ALIGN_PHASE)
 
     @property
     def scpi_version(self) -> str:
@@ -92,7 +264,7 @@ class RigolDG4000:
 
         :return: SCPI version information
         """
-        return self.ins_handle.query("SYST:VERS?").strip()
+        return self._query("SYST:VERS?").strip()
 
     def reset(self) -> None:
         """
@@ -100,7 +272,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("*RST")
+        self._write_raw(_CMD_RESET)
 
     def beep(self) -> None:
         """
@@ -108,7 +280,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:BEEP")
+        self._write_raw(_CMD_BEEP)
 
     @property
     def beeper_enabled(self) -> bool:
@@ -117,7 +289,7 @@ class RigolDG4000:
 
         :return: True if enabled false otherwise
         """
-        return self.on_off_inv[self.ins_handle.query("SYST:BEEP:STAT?").strip()]
+        return self._qb("SYST:BEEP:STAT?")
 
     @beeper_enabled.setter
     def beeper_enabled(self, val: bool) -> None:
@@ -127,8 +299,7 @@ class RigolDG4000:
         :param val: Beeper enable state
         :return: None
         """
-        on_off_val = self.on_off_lut[val]
-        self.ins_handle.write(f"SYST:BEEP:STAT {on_off_val}")
+        self._write(f"SYST:BEEP:STAT {'ON' if val else 'OFF'}")
 
     def copy_config_to_ch1(self) -> None:
         """
@@ -136,7 +307,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:CSC CH2,CH1")
+        self._write_raw(_CMD_CSC_TO_CH1)
 
     def copy_config_to_ch2(self) -> None:
         """
@@ -144,7 +315,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:CSC CH1,CH2")
+        self._write_raw(_CMD_CSC_TO_CH2)
 
     def copy_waveform_to_ch1(self) -> None:
         """
@@ -152,7 +323,7 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:CWC CH2,CH1")
+        self._write_raw(_CMD_CWC_TO_CH1)
 
     def copy_waveform_to_ch2(self) -> None:
         """
@@ -160,43 +331,88 @@ class RigolDG4000:
 
         :return: None
         """
-        self.ins_handle.write("SYST:CWC CH1,CH2")
+        self._write_raw(_CMD_CWC_TO_CH2)
 
     def get_error(self) -> str:
-        return self.ins_handle.query("SYST:ERR?")
+        return self._query("SYST:ERR?")
 
     @property
     def keyboard_locked(self) -> bool:
-        return self.on_off_inv[self.ins_handle.query("SYST:KLOCK?").strip()]
+        return self._qb("SYST:KLOCK?")
 
     @keyboard_locked.setter
     def keyboard_locked(self, val: bool) -> None:
-        on_off_val = self.on_off_lut[val]
-        self.ins_handle.write(f"SYST:KLOCK {on_off_val}")
+        self._write(f"SYST:KLOCK {'ON' if val else 'OFF'}")
 
     @property
     def reference_clock(self) -> "RigolDG4000.Clk":
-        return self.Clk(self.ins_handle.query("SYST:ROSC:SOUR?").strip())
+        return self._qe("SYST:ROSC:SOUR?", self.Clk)
 
     @reference_clock.setter
     def reference_clock(self, val: "RigolDG4000.Clk") -> None:
-        self.ins_handle.write(f"SYST:ROSC:SOUR {val.value}")
+        self._write(f"SYST:ROSC:SOUR {val.value}")
+
+    @property
+    def _use_binary(self) -> bool:
+        """Whether the session and environment can do binary block uploads."""
+        return np is not None and hasattr(self.ins_handle, "write_binary_values")
 
     def upload_data(self, data: Collection[float]) -> None:
         """
         Upload data to the AWG memory.
 
-        :arg Collection[float] data: Collection datapoints as floats
+        Takes the binary block path when the session supports it and
+        falls back to the comma-separated ASCII form otherwise.
+
+        :arg Collection[float] data: Collection of datapoints as floats (-1 to 1)
         """
-        if 1 <= len(data) <= 16384:
-            # Convert the input to a comma-separated string
+        if not 1 <= len(data) <= 16384:
+            raise Exception(
+                f"Data length of {len(data)} is not in the range of 1 to 16384"
+            )
+        if self._use_binary:
+            return self.upload_data_binary(data)
+        # Convert the input to a comma-separated string; np.char.mod
+        # formats the whole buffer in C instead of a per-float
+        # format() loop, which dominates full 16384-point uploads
+        if np is not None:
+            arr = np.asarray(data, dtype=np.float64)
+            string = ",".join(np.char.mod("%.9f", arr).tolist())
+        else:
             string = ",".join(format(f, ".9f") for f in data)
 
-            self.ins_handle.write(f"DATA VOLATILE,{string}")
-        else:
+        self._write(f"DATA VOLATILE,{string}")
+
+    def upload_data_binary(self, data: Collection[float]) -> None:
+        """
+        Upload data to the AWG memory as a definite-length binary block.
+
+        DATA:DAC VOLATILE carries raw 14-bit DAC codes, two bytes per
+        point — far denser than 9-digit ASCII floats and with no
+        per-float formatting.
+
+        :arg Collection[float] data: Collection of datapoints as floats (-1 to 1)
+        """
+        if not 1 <= len(data) <= 16384:
             raise Exception(
                 f"Data length of {len(data)} is not in the range of 1 to 16384"
             )
+        arr = np.asarray(data, dtype=np.float64)
+        # Map -1..1 onto the 14-bit DAC range 0..16383
+        codes = np.round((np.clip(arr, -1.0, 1.0) + 1.0) * (16383 / 2.0)).astype(
+            "<u2"
+        )
+        with self._lock:
+            # Writes buffered by pipeline() must land before the block
+            self._flush_locked()
+            if self._cache:
+                self._cache.clear()
+            self.ins_handle.write_binary_values(
+                "DATA:DAC VOLATILE,",
+                codes,
+                datatype="H",
+                is_big_endian=False,
+            )
 
     def __getitem__(self, item: int) -> "RigolDG4000.Channel":
         """Used to select the channel"""
@@ -234,26 +450,61 @@ class RigolDG4000:
         Int = "INT"
         Ext = "EXT"
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class IDNData:
         vendor: str
         model: str
         serial: str
         firmware: str
 
+    @dataclass(frozen=True, slots=True)
+    class AppliedConfig:
+        """Parsed SOUR<n>:APPL? state; fields the function lacks stay None."""
+
+        function: "RigolDG4000.Function"
+        freq: "Union[float, None]" = None
+        amp: "Union[float, None]" = None
+        off: "Union[float, None]" = None
+        phase: "Union[float, None]" = None
+        delay: "Union[float, None]" = None
+
+    # Field layout of the APPL? reply/command per function family
+    _APPL_FIELDS = {
+        Function.Cust: ("freq", "amp", "off", "phase"),
+        Function.Harm: ("freq", "amp", "off", "phase"),
+        Function.Ramp: ("freq", "amp", "off", "phase"),
+        Function.Sine: ("freq", "amp", "off", "phase"),
+        Function.Square: ("freq", "amp", "off", "phase"),
+        Function.User: ("freq", "amp", "off", "phase"),
+        Function.Pulse: ("freq", "amp", "off", "delay"),
+        Function.Noise: ("amp", "off"),
+    }
+
+    # Legacy dict-form configuration keys for each AppliedConfig field
+    _APPL_DICT_KEYS = {
+        "freq": "Freq",
+        "amp": "Amp",
+        "off": "Off",
+        "phase": "Phase",
+        "delay": "Delay",
+    }
+
     class Channel:
-        """Single channel of waveform gen."""
+        """
+        Single channel of waveform gen.
 
-        def __init__(self, parent: "RigolDG4000", chan_num: int):
-            self.parent = parent
-            # Copy parent consts
-            self.on_off_lut = parent.on_off_lut
-            self.on_off_inv = parent.on_off_inv
-            self.ins_handle = parent.ins_handle
-            self.Function = parent.Function
-            self.Pol = parent.Pol
+        Concrete channels come from :func:`_make_channel_class`, which
+        bakes every command string for one channel number into a
+        subclass body; instances only carry the parent reference.
+        """
+
+        __slots__ = ("parent",)
 
-            self.chan_num = chan_num
+        # Baked in per channel number by _make_channel_class
+        chan_num: int
+
+        def __init__(self, parent: "RigolDG4000"):
+            self.parent = parent
 
         @property
         def enabled(self) -> bool:
@@ -262,9 +513,7 @@ class RigolDG4000:
 
             :return: If the channel is enabled
             """
-            return self.on_off_inv[
-                self.ins_handle.query(f"OUTP{self.chan_num}:STAT?").strip()
-            ]
+            return self.parent._qb(self._q_enabled)
 
         @enabled.setter
         def enabled(self, val: bool) -> None:
@@ -274,8 +523,9 @@ class RigolDG4000:
             :param val: True to enable false to disable
             :return: None
             """
-            on_off_val = self.on_off_lut[val]
-            self.ins_handle.write(f"OUTP{self.chan_num}:STAT {on_off_val}")
+            self.parent._write_raw(
+                self._cmd_enable_on if val else self._cmd_enable_off
+            )
 
         @property
         def sync_enabled(self) -> bool:
@@ -284,9 +534,7 @@ class RigolDG4000:
 
             :return: True if enabled false otherwise
             """
-            return self.on_off_inv[
-                self.ins_handle.query(f"OUTP{self.chan_num}:SYNC?").strip()
-            ]
+            return self.parent._qb(self._q_sync)
 
         @sync_enabled.setter
         def sync_enabled(self, val: bool) -> None:
@@ -296,8 +544,7 @@ class RigolDG4000:
             :param val: True o enable false to disable
             :return: None
             """
-            on_off_val = self.on_off_lut[val]
-            self.ins_handle.write(f"OUTP{self.chan_num}:SYNC {on_off_val}")
+            self.parent._write_raw(self._cmd_sync_on if val else self._cmd_sync_off)
 
         @property
         def polarity(self) -> "RigolDG4000.Pol":
@@ -306,7 +553,7 @@ class RigolDG4000:
 
             :return: RigolDG4000.Pol object
             """
-            return self.Pol(self.ins_handle.query(f"OUTP{self.chan_num}:POL?").strip())
+            return self.parent._qe(self._q_pol, self.parent.Pol)
 
         @polarity.setter
         def polarity(self, val: "RigolDG4000.Pol") -> None:
@@ -316,239 +563,241 @@ class RigolDG4000:
             :param val: RigolDG4000.Pol
             :return: None
             """
-            self.ins_handle.write(f"OUTP{self.chan_num}:POL {val.value}")
+            self.parent._write(self._tpl_pol(val.value))
 
         @property
         def phase(self) -> float:
-            return float(self.ins_handle.query(f"SOUR{self.chan_num}:PHAS?").strip())
+            return self.parent._qf(self._q_phase)
 
         @phase.setter
         def phase(self, val: float) -> None:
             if not 0 <= val <= 360:
                 raise ValueError(f"phase of {val} is outside (0-360)")
-            self.ins_handle.write(f"SOUR{self.chan_num}:PHAS {val}")
+            self.parent._write(self._tpl_phase(val))
 
         @property
         def sync_polarity(self) -> "RigolDG4000.Pol":
-            return self.Pol(
-                self.ins_handle.query(f"OUTP{self.chan_num}:SYNC:POL?").strip()
-            )
+            return self.parent._qe(self._q_sync_pol, self.parent.Pol)
 
         @sync_polarity.setter
         def sync_polarity(self, val: "RigolDG4000.Pol") -> None:
-            self.ins_handle.write(f"OUTP{self.chan_num}:SYNC:POL {val.value}")
+            self.parent._write(self._tpl_sync_pol(val.value))
 
         @property
         def function(self) -> "RigolDG4000.Function":
             get_str = (
-                self.ins_handle.query(f"SOUR{self.chan_num}:APPL?")
+                self.parent._query(self._q_appl)
                 .strip()
                 .strip('"')
                 .split(",")
             )
-            return self.Function(get_str[0])
+            return self.parent.Function(get_str[0])
 
         @function.setter
         def function(self, val: "RigolDG4000.Function") -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:APPL:{val.value}")
+            self.parent._write(self._tpl_func(val.value))
 
         @property
-        def configuration(self) -> dict:
+        def configuration(self) -> "RigolDG4000.AppliedConfig":
             get_str = (
-                self.ins_handle.query(f"SOUR{self.chan_num}:APPL?")
+                self.parent._query(self._q_appl)
                 .strip()
                 .strip('"')
                 .split(",")
             )
-            func = self.Function(get_str[0])
-            if func in [
-                self.Function.Cust,
-                self.Function.Harm,
-                self.Function.Ramp,
-                self.Function.Sine,
-                self.Function.Square,
-                self.Function.User,
-            ]:
-                return {
-                    "Function": func,
-                    "Freq": float(get_str[1]),
-                    "Amp": float(get_str[2]),
-                    "Off": float(get_str[3]),
-                    "Phase": float(get_str[4]),
-                }
-            elif func == self.Function.Pulse:
-                return {
-                    "Function": func,
-                    "Freq": float(get_str[1]),
-                    "Amp": float(get_str[2]),
-                    "Off": float(get_str[3]),
-                    "Delay": float(get_str[4]),
-                }
-            elif func == self.Function.Noise:
-                return {
-                    "Function": func,
-                    "Amp": float(get_str[1]),
-                    "Off": float(get_str[2]),
-                }
-            else:
-                raise ValueError(f"Function {func} is not supported!")
+            func = self.parent.Function(get_str[0])
+            try:
+                fields = RigolDG4000._APPL_FIELDS[func]
+            except KeyError:
+                raise ValueError(f"Function {func} is not supported!") from None
+            return RigolDG4000.AppliedConfig(
+                func, **dict(zip(fields, map(float, get_str[1:])))
+            )
 
         @configuration.setter
-        def configuration(self, val: Union[dict, "RigolDG4000.Function"]) -> None:
+        def configuration(
+            self,
+            val: Union["RigolDG4000.AppliedConfig", "RigolDG4000.Function", dict],
+        ) -> None:
             """
-            Requires all the keys for the specified function, or no keys:
+            Accepts an AppliedConfig, a bare Function (defaults applied), or
+            the legacy dict form with all keys for the specified function:
             - Function, Freq, Amp, Off, Phase for Cust, Harm, Ramp, Sine, Square, and User
             - Function, Freq, Amp, Off, Delay for Pulse
             - Function, Amp, Off for Noise
-
-            TODO: Make object
             """
-            if isinstance(val, self.Function):
-                self.ins_handle.write(f"SOUR{self.chan_num}:APPL:{val.value}")
-            elif val["Function"] in [
-                self.Function.Cust,
-                self.Function.Harm,
-                self.Function.Ramp,
-                self.Function.Sine,
-                self.Function.Square,
-                self.Function.User,
-            ]:
-                self.ins_handle.write(
-                    f"SOUR{self.chan_num}:APPL:{val['Function'].value}"
-                    f" {val['Freq']:.6e},{val['Amp']:.6e},{val['Off']:.6e},{val['Phase']:.6e}"
-                )
-            elif val["Function"] == self.Function.Pulse:
-                self.ins_handle.write(
-                    f"SOUR{self.chan_num}:APPL:{val['Function'].value}"
-                    f" {val['Freq']:.6e},{val['Amp']:.6e},{val['Off']:.6e},{val['Delay']:.6e}"
-                )
-            elif val["Function"] == self.Function.Noise:
-                self.ins_handle.write(
-                    f"SOUR{self.chan_num}:APPL:{val['Function'].value}"
-                    f" {val['Amp']:.6e},{val['Off']:.6e}"
-                )
+            if isinstance(val, self.parent.Function):
+                self.parent._write(self._tpl_func(val.value))
+                return
+            if isinstance(val, RigolDG4000.AppliedConfig):
+                func = val.function
+                nums = [
+                    getattr(val, name) for name in RigolDG4000._APPL_FIELDS[func]
+                ]
+            else:
+                func = val["Function"]
+                nums = [
+                    val[RigolDG4000._APPL_DICT_KEYS[name]]
+                    for name in RigolDG4000._APPL_FIELDS[func]
+                ]
+            args = ",".join(f"{v:.6e}" for v in nums)
+            self.parent._write(self._tpl_appl(func.value, args))
 
         @property
         def frequency_center(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:FREQ:CENT?").strip()
-            )
+            return self.parent._qf(self._q_freq_center)
 
         @frequency_center.setter
         def frequency_center(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:FREQ:CENT {val}")
+            self.parent._write(self._tpl_freq_center(val))
 
         @property
         def frequency(self) -> float:
-            return float(self.ins_handle.query(f"SOUR{self.chan_num}:FREQ?").strip())
+            return self.parent._qf(self._q_freq)
 
         @frequency.setter
         def frequency(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:FREQ {val}")
+            self.parent._write(self._tpl_freq(val))
 
         @property
         def amplitude(self) -> float:
-            return float(self.ins_handle.query(f"SOUR{self.chan_num}:VOLT?").strip())
+            return self.parent._qf(self._q_amp)
 
         @amplitude.setter
         def amplitude(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:VOLT {val}")
+            self.parent._write(self._tpl_amp(val))
 
         @property
         def offset(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:VOLT:OFFS?").strip()
-            )
+            return self.parent._qf(self._q_offset)
 
         @offset.setter
         def offset(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:VOLT:OFFS {val}")
+            self.parent._write(self._tpl_offset(val))
 
         @property
         def sweep_start(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:FREQ:STAR?").strip()
-            )
+            return self.parent._qf(self._q_sweep_start)
 
         @sweep_start.setter
         def sweep_start(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:FREQ:STAR {val}")
+            self.parent._write(self._tpl_sweep_start(val))
 
         @property
         def sweep_stop(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:FREQ:STOP?").strip()
-            )
+            return self.parent._qf(self._q_sweep_stop)
 
         @sweep_stop.setter
         def sweep_stop(self, val: float) -> None:
-            self.ins_handle.write(f"SOUR{self.chan_num}:FREQ:STOP {val}")
+            self.parent._write(self._tpl_sweep_stop(val))
 
         @property
         def ramp_symmetry(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:FUNC:RAMP:SYMM?").strip()
-            )
+            return self.parent._qf(self._q_ramp_symm)
 
         @ramp_symmetry.setter
         def ramp_symmetry(self, val: float) -> None:
             if not 0 <= val <= 100:
                 raise ValueError(f"ramp_symmetry must be from 0-100%! not {val}")
-            self.ins_handle.write(f"SOUR{self.chan_num}:FUNC:RAMP:SYMM {val}")
+            self.parent._write(self._tpl_ramp_symm(val))
 
         @property
         def square_duty_cycle(self) -> float:
-            return float(
-                self.ins_handle.query(f"SOUR{self.chan_num}:FUNC:SQU:DCYC?").strip()
-            )
+            return self.parent._qf(self._q_squ_dcyc)
 
         @square_duty_cycle.setter
         def square_duty_cycle(self, val: float) -> None:
             if not 20 <= val <= 80:
                 raise ValueError(f"square_duty_cycle must be from 20-80%! not {val}")
-            self.ins_handle.write(f"SOUR{self.chan_num}:FUNC:SQU:DCYC {val}")
+            self.parent._write(self._tpl_squ_dcyc(val))
 
         @property
         def output_impedance(self) -> float:
-            res = self.ins_handle.query(f"OUTP{self.chan_num}:IMP?").strip()
+            res = self.parent._query(self._q_imp).strip()
             try:
                 return float(res)
             except ValueError:
-                if "MIN" in res:
-                    return 0
-                if "MAX" in res:
-                    return 10001
-                if "INF" in res:
-                    return math.inf
-                return float(res)
+                return _IMP_NAMES[res[:3]]
 
         @output_impedance.setter
         def output_impedance(self, val: float) -> None:
-            if val < 1:
-                set_val = "MIN"
-            elif math.isinf(val):
-                set_val = "INF"
-            elif val > 10000:
-                set_val = "MAX"
-            else:
-                set_val = str(val)
-            self.ins_handle.write(f"OUTP{self.chan_num}:IMP {set_val}")
+            set_val = (
+                "MIN"
+                if val < 1
+                else "INF" if _isinf(val) else "MAX" if val > 10000 else str(val)
+            )
+            self.parent._write(self._tpl_imp(set_val))
+
+
+@functools.lru_cache(maxsize=None)
+def _make_channel_class(chan_num: int) -> type:
+    """
+    Specialize RigolDG4000.Channel for one channel number.
 
+    Every command string is baked into the subclass namespace as a
+    constant, so the hot properties do a plain attribute load instead of
+    interpolating the channel number per call. Classes are cached, so
+    all DG4000 instances share one specialized class per channel.
+    """
+    ns = {
+        "__slots__": (),
+        "chan_num": chan_num,
+        # On/off commands pre-encoded (terminator included) for write_raw
+        "_cmd_enable_on": f"OUTP{chan_num}:STAT ON\n".encode("ascii"),
+        "_cmd_enable_off": f"OUTP{chan_num}:STAT OFF\n".encode("ascii"),
+        "_cmd_sync_on": f"OUTP{chan_num}:SYNC ON\n".encode("ascii"),
+        "_cmd_sync_off": f"OUTP{chan_num}:SYNC OFF\n".encode("ascii"),
+        # Query commands
+        "_q_enabled": f"OUTP{chan_num}:STAT?",
+        "_q_sync": f"OUTP{chan_num}:SYNC?",
+        "_q_pol": f"OUTP{chan_num}:POL?",
+        "_q_sync_pol": f"OUTP{chan_num}:SYNC:POL?",
+        "_q_appl": f"SOUR{chan_num}:APPL?",
+        "_q_phase": f"SOUR{chan_num}:PHAS?",
+        "_q_freq": f"SOUR{chan_num}:FREQ?",
+        "_q_freq_center": f"SOUR{chan_num}:FREQ:CENT?",
+        "_q_amp": f"SOUR{chan_num}:VOLT?",
+        "_q_offset": f"SOUR{chan_num}:VOLT:OFFS?",
+        "_q_sweep_start": f"SOUR{chan_num}:FREQ:STAR?",
+        "_q_sweep_stop": f"SOUR{chan_num}:FREQ:STOP?",
+        "_q_ramp_symm": f"SOUR{chan_num}:FUNC:RAMP:SYMM?",
+        "_q_squ_dcyc": f"SOUR{chan_num}:FUNC:SQU:DCYC?",
+        "_q_imp": f"OUTP{chan_num}:IMP?",
+        # Setter templates pre-bound to str.format
+        "_tpl_pol": f"OUTP{chan_num}:POL {{}}".format,
+        "_tpl_sync_pol": f"OUTP{chan_num}:SYNC:POL {{}}".format,
+        "_tpl_func": f"SOUR{chan_num}:APPL:{{}}".format,
+        "_tpl_appl": f"SOUR{chan_num}:APPL:{{}} {{}}".format,
+        "_tpl_freq": f"SOUR{chan_num}:FREQ {{}}".format,
+        "_tpl_freq_center": f"SOUR{chan_num}:FREQ:CENT {{}}".format,
+        "_tpl_amp": f"SOUR{chan_num}:VOLT {{}}".format,
+        "_tpl_offset": f"SOUR{chan_num}:VOLT:OFFS {{}}".format,
+        "_tpl_phase": f"SOUR{chan_num}:PHAS {{}}".format,
+        "_tpl_sweep_start": f"SOUR{chan_num}:FREQ:STAR {{}}".format,
+        "_tpl_sweep_stop": f"SOUR{chan_num}:FREQ:STOP {{}}".format,
+        "_tpl_ramp_symm": f"SOUR{chan_num}:FUNC:RAMP:SYMM {{}}".format,
+        "_tpl_squ_dcyc": f"SOUR{chan_num}:FUNC:SQU:DCYC {{}}".format,
+        "_tpl_imp": f"OUTP{chan_num}:IMP {{}}".format,
+    }
+    return type(f"_Channel{chan_num}", (RigolDG4000.Channel,), ns)
 
 if __name__ == "__main__":
     ins = RigolDG4000("TCPIP0::192.168.5.239::INSTR")
 
     # ins.upload_data([0, 0])
 
+    # One compound write per channel instead of a round-trip per setter
     for i in [1, 2]:
-        ins[i].function = ins.Function.Ramp
-        ins[i].frequency = 158e3
-        ins[i].output_impedance = math.inf
-        ins[i].amplitude = 15.7
-        ins[i].ramp_symmetry = 10
-
-    ins[1].enabled = True
-    ins[2].enabled = True
+        ins.batch_write(
+            [
+                f"SOUR{i}:APPL:RAMP",
+                f"SOUR{i}:FREQ {158e3}",
+                f"OUTP{i}:IMP INF",
+                f"SOUR{i}:VOLT 15.7",
+                f"SOUR{i}:FUNC:RAMP:SYMM 10",
+                f"OUTP{i}:STAT ON",
+            ]
+        )
 
     ins.align_phase()
 
@@ -3,10 +3,13 @@ import logging
 from enum import Enum
 from typing import Optional
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import InstrumentBase, InstrumentInterface
 
 logger = logging.getLogger(__name__)
 
+# Overrange sentinel the 8840A returns in place of a reading
+_FLUKE_INF = 9.99999e9
+
 
 class Fluke8840ARange(Enum):
     """Fluke8840A Range Enum"""
@@ -45,24 +48,17 @@ class Fluke8840ARate(Enum):
     FAST = "S2"
 
 
-class Fluke8840A:
+class Fluke8840A(InstrumentBase):
+    __slots__ = ("_range", "_function", "_rate", "_offset", "_blank")
+
     def __init__(self, ins: InstrumentInterface):
-        self.ins = ins
+        super().__init__(ins)
         self._range: Optional[Fluke8840ARange] = None
         self._function: Optional[Fluke8840AFunction] = None
         self._rate: Optional[Fluke8840ARate] = None
         self._offset: Optional[bool] = None
         self._blank: Optional[bool] = None
 
-    def _write_data(self, dat: str) -> None:
-        self.ins.write(dat)
-
-    def _read_data(self) -> str:
-        return self.ins.read()
-
-    def _query_data(self, dat: str, retry_limit: int = 10) -> str:
-        return self.ins.query(dat)
-
     def reset(self) -> None:
         self._write_data("*")
 
@@ -122,8 +118,9 @@ class Fluke8840A:
         val = self._query_data("?")
         if val is None:
             return math.nan
-        val_f = float(val.split()[-1])
-        if val_f == 9.99999e9:
+        # rpartition grabs the value token without the list split() allocates
+        val_f = float(val.rstrip().rpartition(" ")[2])
+        if val_f == _FLUKE_INF:
             return math.inf
         return val_f
 
@@ -1,10 +1,18 @@
 import logging
+import functools
+import contextlib
+import asyncio
 import warnings
 from enum import Enum
 from typing import Optional, cast
 from dataclasses import dataclass
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import (
+    InstrumentBase,
+    InstrumentInterface,
+    parse_scpi_error,
+    parse_scpi_float,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +31,20 @@ class GWPSMPSURange(Enum):
     HIGH = "HIGH"
 
 
-class GWPSMPSU:
+class GWPSMPSU(InstrumentBase):
+    __slots__ = ("model", "curr_range_map", "_defer_err")
+
     on_off_lut: dict[bool, str] = {True: "ON", False: "OFF"}
-    on_off_inv: dict[str, bool] = {"1": True, "0": False}
+    # Includes the trailing-terminator variants seen on real GPIB reads so
+    # the common case maps without allocating a stripped copy first.
+    on_off_inv: dict[str, bool] = {
+        "1": True,
+        "0": False,
+        "1\n": True,
+        "0\n": False,
+        "1\r\n": True,
+        "0\r\n": False,
+    }
 
     # Range map
     range_map: dict[str, dict[str, GWPSMPSURange]] = {
@@ -45,57 +64,99 @@ class GWPSMPSU:
 
     curr_range_map: Optional[dict[str, GWPSMPSURange]]
 
+    # IDN replies keyed by the underlying session, so re-opening a driver on
+    # the same interface (short-lived scripts) skips the *IDN? round-trip.
+    _idn_cache: dict[object, str] = {}
+
+    # Pre-bound format methods so hot setters skip re-parsing the template
+    _FMT_APPLY = ":APPLY {},{}".format
+    _FMT_CURR = ":CURR {}".format
+    _FMT_VOLT = ":VOLT {}".format
+
     def __init__(self, ins: InstrumentInterface, error_check=True):
         """
         Driver for GW Instek PSM-Series DC Supply (PSM-2010, PSM-3004, PSM-6003)
 
         If error_check is False commands will not be checked for errors after being run.
         """
-        self.ins = ins
-        try:
-            self.model = self._query_data("*IDN?").split(",")[1]
-            self.curr_range_map = self.range_map[self.model]
-        except (IndexError, KeyError):
-            self.model = "Unknown"
-            self.curr_range_map = None
+        super().__init__(ins)
+        self._defer_err = False
+        key = getattr(ins, "resource_name", None) or id(ins)
+        model = self._idn_cache.get(key)
+        if model is None:
+            try:
+                model = self._query_data("*IDN?").split(",")[1]
+            except IndexError:
+                model = "Unknown"
+            GWPSMPSU._idn_cache[key] = model
+        self.curr_range_map = self._resolve_range_map(model)
+        self.model = model if self.curr_range_map is not None else "Unknown"
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _resolve_range_map(cls, model: str) -> Optional[dict[str, GWPSMPSURange]]:
+        """Resolve the per-model range map once and share it across instances."""
+        return cls.range_map.get(model)
+
+    def _check_error(self, action: str) -> None:
+        if self._defer_err:
+            return
+        if (e := self.error) is not None:
+            raise RuntimeError(f"Exception setting {action} {e}")
+
+    @contextlib.contextmanager
+    def deferred_error_check(self):
+        """
+        Batch the per-setter error checks into one query at block exit.
 
-    def _write_data(self, dat: str) -> None:
-        self.ins.write(dat)
+        .. code-block:: python
 
-    def _read_data(self) -> str:
-        return self.ins.read()
+            with psu.deferred_error_check():
+                psu.volt = 5
+                psu.curr = 0.1
 
-    def _query_data(self, dat: str) -> str:
-        return self.ins.query(dat)
+        Setters inside the block skip their own SYST:ERR? readback; a
+        single check runs when the block exits, so N sets cost N+1
+        transactions instead of 2N.
+        """
+        self._defer_err = True
+        try:
+            yield self
+            if (e := self.error) is not None:
+                raise RuntimeError(f"Exception in deferred error check block {e}")
+        finally:
+            self._defer_err = False
+
+    def _to_bool(self, res: str) -> bool:
+        try:
+            return self.on_off_inv[res]
+        except KeyError:
+            return self.on_off_inv[res.strip()]
 
     def set_iv(self, v: float, i: float):
-        self._write_data(f":APPLY {v},{i}")
+        self._write_data(self._FMT_APPLY(v, i))
 
     @property
     def curr(self):
         """Current set point"""
-        self._write_data(":CURR?")
-        return float(self._read_data())
+        return parse_scpi_float(self._query_data(":CURR?"))
 
     @curr.setter
     def curr(self, val: float):
         """Current set point"""
-        self._write_data(f":CURR {val}")
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting current {e}")
+        self._write_data(self._FMT_CURR(val))
+        self._check_error("current")
 
     @property
     def volt(self):
         """Volt set point"""
-        self._write_data(":VOLT?")
-        return float(self._read_data())
+        return parse_scpi_float(self._query_data(":VOLT?"))
 
     @volt.setter
     def volt(self, val: float):
         """Volt set point"""
-        self._write_data(f":VOLT {val}")
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting volt {e}")
+        self._write_data(self._FMT_VOLT(val))
+        self._check_error("volt")
 
     @property
     def range(self):
@@ -112,52 +173,68 @@ class GWPSMPSU:
     def range(self, val: GWPSMPSURange):
         """Range set"""
         self._write_data(f":VOLT:RANG {val.value}")
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting range {e}")
+        self._check_error("range")
+
+    # Whether the instrument accepts ;-chained compound queries
+    supports_chaining = True
+
+    def meas_vi(self) -> tuple[float, float]:
+        """
+        Measure output voltage and current in one transaction.
+
+        Chains :MEAS? and :MEAS:CURR? into a single compound query, so a
+        dual-parameter sweep pays one round-trip instead of two. Set
+        supports_chaining False (on the class) to fall back to two reads.
+        """
+        if self.supports_chaining:
+            v, i = self._query_data(":MEAS?;:MEAS:CURR?").strip().split(";")
+            return float(v), float(i)
+        return self.v_meas, self.i_meas
 
     @property
     def v_meas(self):
-        self._write_data(":MEAS?")
-        return float(self._read_data())
+        return parse_scpi_float(self._query_data(":MEAS?"))
 
     @property
     def i_meas(self):
-        self._write_data(":MEAS:CURR?")
-        return float(self._read_data())
+        return parse_scpi_float(self._query_data(":MEAS:CURR?"))
+
+    async def a_v_meas(self) -> float:
+        """Async variant of :attr:`v_meas`; the blocking query runs in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.v_meas
+        )
+
+    async def a_i_meas(self) -> float:
+        """Async variant of :attr:`i_meas`; the blocking query runs in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.i_meas
+        )
 
     @property
     def output(self):
-        self._write_data(":OUTP:STAT?")
-        return self._read_data()
+        return self._query_data(":OUTP:STAT?")
 
     @output.setter
     def output(self, val):
-        if val:
-            self._write_data(":OUTP ON")
-        else:
-            self._write_data(":OUTP OFF")
-
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting output {e}")
+        self._write_data(f":OUTP {self.on_off_lut[bool(val)]}")
+        self._check_error("output")
 
     def beep(self):
         """The instrument returns a single beep immediately."""
         self._write_data("SYST:BEEP")
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting beep {e}")
+        self._check_error("beep")
 
     @property
     def beeper(self) -> bool:
         """Switches the front panel control beeper on or off."""
-        res = self._query_data("SYST:BEEP:STAT?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data("SYST:BEEP:STAT?"))
 
     @beeper.setter
     def beeper(self, val: bool) -> None:
         """Switches the front panel control beeper on or off."""
         self._write_data(f"SYST:BEEP:STAT {self.on_off_lut[val]}")
-        if (e := self.error) is not None:
-            raise RuntimeError(f"Exception setting beeper {e}")
+        self._check_error("beeper")
 
     def reset(self) -> None:
         self._write_data("*RST")
@@ -167,18 +244,19 @@ class GWPSMPSU:
     def error(self) -> Optional[GWPSMPSUError]:
         """Pop the latest error from the error stack; None if there are no errors."""
         res = self._query_data("SYST:ERR?").strip()
-        raw_code, val = res.split(",")
-        code = int(raw_code.strip())
-        val = val.strip('"')
-        if code == 0:
+        parsed = parse_scpi_error(res)
+        if parsed is None:
             return None
-        return GWPSMPSUError(code=code, text=val, raw_str=res)
+        code, text = parsed
+        return GWPSMPSUError(code=code, text=text, raw_str=res)
 
 
 if __name__ == "__main__":
     import pyvisa
 
-    rm = pyvisa.ResourceManager()
+    from ialib.interfaces.visa_rm import get_resource_manager
+
+    rm = get_resource_manager()
     ins_interface = cast(
         pyvisa.resources.MessageBasedResource, rm.open_resource("GPIB0::7::INSTR")
     )
@@ -1,13 +1,18 @@
+import re
 import math
 import logging
+import asyncio
 from enum import Enum
 from typing import Optional, cast
 from dataclasses import dataclass
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import InstrumentInterface, parse_scpi_error
 
 logger = logging.getLogger(__name__)
 
+# One <code>,"<text>" entry in a SYST:ERR:ALL? reply
+_ERR_ALL_RE = re.compile(r'([-+]?\d+),"(.*?)"')
+
 
 @dataclass(frozen=True)
 class HP34401AError:
@@ -43,11 +48,26 @@ HP34401A_MIN_DIGITS = 4
 
 
 class HP34401A:
+    __slots__ = ("ins", "_mode_cache")
+
     on_off_lut: dict[bool, str] = {True: "ON", False: "OFF"}
-    on_off_inv: dict[str, bool] = {"1": True, "0": False}
+    # Includes the trailing-terminator variants seen on real GPIB reads so
+    # the common case maps without allocating a stripped copy first.
+    on_off_inv: dict[str, bool] = {
+        "1": True,
+        "0": False,
+        "1\n": True,
+        "0\n": False,
+        "1\r\n": True,
+        "0\r\n": False,
+    }
+
+    # Pre-bound format method so the hot setter skips re-parsing the template
+    _FMT_NULL_OFST = "CALC:NULL:OFFS {:.8E}".format
 
     def __init__(self, ins: InstrumentInterface):
         self.ins = ins
+        self._mode_cache: Optional[HP34401AFunction] = None
 
     def _write_data(self, dat: str) -> None:
         logger.debug(f"Write: {dat}")
@@ -67,9 +87,16 @@ class HP34401A:
         logger.debug(f"Query Get: {ret}")
         return ret
 
+    def _to_bool(self, res: str) -> bool:
+        try:
+            return self.on_off_inv[res]
+        except KeyError:
+            return self.on_off_inv[res.strip()]
+
     def reset(self) -> None:
         self._write_data("*RST")
         self._write_data("*CLS")
+        self._mode_cache = None
 
     def beep(self):
         """The instrument returns a single beep immediately."""
@@ -78,8 +105,7 @@ class HP34401A:
     @property
     def beeper(self) -> bool:
         """Switches the front panel control beeper on or off."""
-        res = self._query_data("SYST:BEEP:STAT?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data("SYST:BEEP:STAT?"))
 
     @beeper.setter
     def beeper(self, val: bool) -> None:
@@ -100,21 +126,61 @@ class HP34401A:
             return math.inf
         return val_f
 
+    def data_block(self, n: int) -> list[float]:
+        """
+        Take n readings and fetch them in a single transfer.
+
+        SAMP:COUN plus one FETC? moves the whole block back in one reply
+        instead of n READ? round-trips. The reading memory holds 512
+        samples.
+
+        :param int n: Number of readings to take (1-512)
+        :raises ValueError: If the sample count is out of range
+        :return: List of readings
+        """
+        if not 1 <= n <= 512:
+            raise ValueError(f"Sample count must be between 1 and 512 not {n}!")
+        self._write_data(f"SAMP:COUN {n}")
+        try:
+            self._write_data("INIT")
+            res = self._query_data("FETC?")
+        finally:
+            # Restore single-sample mode so later READ? calls (the data
+            # property) get one reading back, not n
+            self._write_data("SAMP:COUN 1")
+        return [float(v) for v in res.split(",")]
+
+    async def a_data(self) -> float:
+        """
+        Async variant of :attr:`data`.
+
+        Runs the blocking GPIB query in the default executor so readings
+        from several instruments can overlap via ``asyncio.gather``.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.data
+        )
+
     @property
     def mode(self) -> HP34401AFunction:
-        return HP34401AFunction(
-            self._query_data("CONF?").strip().strip('"').strip().split(" ")[0]
-        )
+        # The mode only changes through the setter or a reset, so a cached
+        # value saves the CONF? round-trip that range/auto_range/nplc all pay.
+        if self._mode_cache is None:
+            # Take the first token with one partition + strip pass instead of
+            # the old strip/strip/strip/split copy chain.
+            raw = self._query_data("CONF?")
+            self._mode_cache = HP34401AFunction(raw.partition(" ")[0].strip(' "\r\n\t'))
+        return self._mode_cache
 
     @mode.setter
     def mode(self, val: HP34401AFunction) -> None:
         self._write_data(f":CONF:{val.value}")
+        self._mode_cache = val
 
     @property
     def null(self) -> bool:
         """Status of the NULL function"""
-        res = self._query_data(":CALC:STAT?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data(":CALC:STAT?"))
 
     @null.setter
     def null(self, val: bool) -> None:
@@ -136,13 +202,12 @@ class HP34401A:
     @null_ofst.setter
     def null_ofst(self, val: float) -> None:
         """Set the null offset."""
-        self._write_data(f"CALC:NULL:OFFS {val:.8E}")
+        self._write_data(self._FMT_NULL_OFST(val))
 
     @property
     def display(self) -> bool:
         """Display enable status."""
-        res = self._query_data(":DISP?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data(":DISP?"))
 
     @display.setter
     def display(self, val: bool) -> None:
@@ -169,12 +234,31 @@ class HP34401A:
     def error(self) -> Optional[HP34401AError]:
         """Pop the latest error from the error stack; None if there are no errors."""
         res = self._query_data("SYST:ERR?").strip()
-        raw_code, val = res.split(",")
-        code = int(raw_code.strip())
-        val = val.strip('"')
-        if code == 0:
+        parsed = parse_scpi_error(res)
+        if parsed is None:
             return None
-        return HP34401AError(code=code, text=val, raw_str=res)
+        code, text = parsed
+        return HP34401AError(code=code, text=text, raw_str=res)
+
+    def drain_errors(self) -> list[HP34401AError]:
+        """
+        Drain the whole error queue in a single round-trip.
+
+        SYST:ERR:ALL? returns every queued error in one reply, so flushing
+        the queue costs one transaction instead of one :attr:`error` query
+        per entry (plus the final "No error" read).
+
+        :return: Queued errors in FIFO order; empty if the queue was clear
+        """
+        res = self._query_data("SYST:ERR:ALL?").strip()
+        errors = []
+        for code_str, text in _ERR_ALL_RE.findall(res):
+            code = int(code_str)
+            if code != 0:
+                errors.append(
+                    HP34401AError(code=code, text=text, raw_str=f'{code_str},"{text}"')
+                )
+        return errors
 
     @property
     def range(self) -> float:
@@ -194,14 +278,15 @@ class HP34401A:
         :raises ValueError: If the commanded range is out of range
         :return: None
         """
-        self._write_data("*CLS")
         if val < 0:
             raise ValueError("Range must be positive!")
         curr_mode = self.mode
+        # Chain the queue clear and the range command into one message so the
+        # whole set costs a single write plus the error readback.
         if math.isinf(val):
-            self._write_data(f":{curr_mode.value}:RANG MAX")
+            self._write_data(f"*CLS;:{curr_mode.value}:RANG MAX")
         else:
-            self._write_data(f":{curr_mode.value}:RANG {val:.2E}")
+            self._write_data(f"*CLS;:{curr_mode.value}:RANG {val:.2E}")
         err = self.error
         if err is not None and err.code == -222:
             raise ValueError(f"Range {val} is out of range! ({err.raw_str})")
@@ -210,8 +295,7 @@ class HP34401A:
     def auto_range(self) -> bool:
         """Auto range state."""
         curr_mode = self.mode
-        res = self._query_data(f":{curr_mode.value}:RANG:AUTO?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data(f":{curr_mode.value}:RANG:AUTO?"))
 
     @auto_range.setter
     def auto_range(self, val: bool) -> None:
@@ -234,8 +318,7 @@ class HP34401A:
     @property
     def azero(self) -> bool:
         """Status of the auto zero function."""
-        res = self._query_data(":ZERO:AUTO?")
-        return self.on_off_inv[res.strip()]
+        return self._to_bool(self._query_data(":ZERO:AUTO?"))
 
     @azero.setter
     def azero(self, val: bool) -> None:
@@ -246,10 +329,12 @@ class HP34401A:
 if __name__ == "__main__":
     import pyvisa
 
+    from ialib.interfaces.visa_rm import get_resource_manager
+
     logging.basicConfig()
     logger.level = logging.DEBUG
 
-    rm = pyvisa.ResourceManager()
+    rm = get_resource_manager()
     ins_interface = cast(
         pyvisa.resources.MessageBasedResource, rm.open_resource("GPIB0::26::INSTR")
     )
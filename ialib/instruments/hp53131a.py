@@ -1,10 +1,15 @@
 import math
 import socket
 import logging
+import asyncio
 from typing import Optional, cast
 from dataclasses import dataclass
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import (
+    InstrumentInterface,
+    parse_scpi_error,
+    parse_scpi_float,
+)
 from ialib.interfaces.plx_gpib_ethernet import PlxGPIBEthDevice, plx_get_first
 
 logger = logging.getLogger(__name__)
@@ -18,20 +23,43 @@ class HP53131AError:
 
 
 class HP53131A(PlxGPIBEthDevice):
+    __slots__ = ("ins", "_write_data", "_read_data")
+
     on_off_lut = {True: "ON", False: "OFF"}
     on_off_inv = {"1": True, "0": False}
 
     def __init__(self, ins: InstrumentInterface):
         self.ins = ins
+        # Bind the interface methods once; each GPIB op then skips a
+        # passthrough method frame. _query_data stays a method for the
+        # timeout handling below.
+        self._write_data = ins.write
+        self._read_data = ins.read
+
+    def _query_data(self, dat: str, timeout: Optional[float] = None) -> str:
+        """
+        Query with an optional one-shot timeout override.
+
+        Long measurements (e.g. many-digit frequency counts) should pass a
+        timeout that covers the gate time instead of relying on the
+        transport retrying a too-short read.
+        """
+        gpib = getattr(self.ins, "gpib", None)
+        if timeout is None or gpib is None:
+            return self.ins.query(dat)
+        old_timeout = gpib.timeout
+        gpib.set_timeout(timeout)
+        try:
+            return self.ins.query(dat)
+        finally:
+            gpib.set_timeout(old_timeout)
 
-    def _write_data(self, dat: str) -> None:
-        self.ins.write(dat)
-
-    def _read_data(self) -> str:
-        return self.ins.read()
-
-    def _query_data(self, dat: str) -> str:
-        return self.ins.query(dat)
+    def query_many(self, cmds: list[str]) -> list[str]:
+        """Batch several queries, using the transport's batched path if it has one."""
+        batched = getattr(self.ins, "query_many", None)
+        if batched is not None:
+            return batched(cmds)
+        return [self.ins.query(cmd) for cmd in cmds]
 
     def reset(self) -> None:
         self._write_data("*RST")
@@ -45,32 +73,39 @@ class HP53131A(PlxGPIBEthDevice):
     def data(self) -> float:
         """Triggers and reads measurement data from the instrument."""
         try:
-            data = float(self._query_data("READ?"))
+            data = parse_scpi_float(self._query_data("READ?"))
         except socket.timeout:
             data = math.nan
         if data == 9.91e37:
             return math.nan
         return data
 
+    async def a_data(self) -> float:
+        """Async variant of :attr:`data`; the blocking query runs in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.data
+        )
+
     @property
     def error(self) -> Optional[HP53131AError]:
         """Pop the latest error from the error stack; None if there are no errors."""
         res = self._query_data("SYST:ERR?").strip()
-        raw_code, val = res.split(",")
-        code = int(raw_code.strip())
-        val = val.strip('"')
-        if code == 0:
+        parsed = parse_scpi_error(res)
+        if parsed is None:
             return None
-        return HP53131AError(code=code, text=val, raw_str=res)
+        code, text = parsed
+        return HP53131AError(code=code, text=text, raw_str=res)
 
 
 if __name__ == "__main__":
     import pyvisa
 
+    from ialib.interfaces.visa_rm import get_resource_manager
+
     logging.basicConfig()
     logger.level = logging.DEBUG
 
-    rm = pyvisa.ResourceManager()
+    rm = get_resource_manager()
     ins_interface = cast(
         pyvisa.resources.MessageBasedResource, rm.open_resource("GPIB0::3::INSTR")
     )
@@ -2,23 +2,30 @@ import time
 import logging
 from typing import Optional, cast
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import InstrumentBase, InstrumentInterface
 
 logger = logging.getLogger(__name__)
 
 
-class Keithley7001:
-    def __init__(self, ins: InstrumentInterface):
-        self.ins = ins
+class Keithley7001(InstrumentBase):
+    __slots__ = ("settle_time",)
 
-    def _write_data(self, dat: str) -> None:
-        self.ins.write(dat)
+    def __init__(self, ins: InstrumentInterface, settle_time: float = 0.0):
+        """
+        Driver for the Keithley 7001 switch system.
 
-    def _read_data(self) -> str:
-        return self.ins.read()
+        Switch commands synchronize on *OPC? which returns once the relays
+        have actually settled; settle_time adds an extra unconditional wait
+        after that for cards that need it.
+        """
+        super().__init__(ins)
+        self.settle_time = settle_time
 
-    def _query_data(self, dat: str) -> str:
-        return self.ins.query(dat)
+    def _wait_settled(self) -> None:
+        """Block until the last switch command has completed."""
+        self._query_data("*OPC?")
+        if self.settle_time:
+            time.sleep(self.settle_time)
 
     def open(self, slot: Optional[int] = None, chan: Optional[int] = None) -> None:
         if slot is None and chan is None:
@@ -31,23 +38,43 @@ class Keithley7001:
                 f"Slot invalid must be 1 or 2! (Slot: {slot}, Chan: {chan})"
             )
         self._write_data(f":OPEN (@{slot}!{chan})")
-        time.sleep(0.25)
+        self._wait_settled()
         return None
 
+    def _chan_list(self, pairs: list[tuple[int, int]]) -> str:
+        for slot, chan in pairs:
+            if slot not in [1, 2]:
+                raise ValueError(
+                    f"Slot invalid must be 1 or 2! (Slot: {slot}, Chan: {chan})"
+                )
+        return ",".join(f"{slot}!{chan}" for slot, chan in pairs)
+
+    def open_many(self, pairs: list[tuple[int, int]]) -> None:
+        """Open several (slot, chan) relays with one command and one settle wait."""
+        self._write_data(f":OPEN (@{self._chan_list(pairs)})")
+        self._wait_settled()
+
+    def close_many(self, pairs: list[tuple[int, int]]) -> None:
+        """Close several (slot, chan) relays with one command and one settle wait."""
+        self._write_data(f":CLOS (@{self._chan_list(pairs)})")
+        self._wait_settled()
+
     def close_sw(self, slot: int, chan: int) -> None:
         if slot not in [1, 2]:
             raise ValueError(
                 f"Slot invalid must be 1 or 2! (Slot: {slot}, Chan: {chan})"
             )
         self._write_data(f":CLOS (@{slot}!{chan})")
-        time.sleep(0.25)
+        self._wait_settled()
         return None
 
 
 if __name__ == "__main__":
     import pyvisa
 
-    rm = pyvisa.ResourceManager()
+    from ialib.interfaces.visa_rm import get_resource_manager
+
+    rm = get_resource_manager()
     ins_interface = cast(
         pyvisa.resources.MessageBasedResource, rm.open_resource("GPIB0::26::INSTR")
     )
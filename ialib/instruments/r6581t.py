@@ -1,14 +1,42 @@
 import math
+import time
 import logging
+import functools
 from enum import Enum
 from typing import Union, Optional, cast
 from dataclasses import dataclass
 
-from ialib.instruments.types import InstrumentInterface
+from ialib.instruments.types import InstrumentInterface, parse_scpi_error
 
 logger = logging.getLogger(__name__)
 
 
+def ttl_cached(seconds: float):
+    """
+    Cache an argument-less getter on the instance for a short window.
+
+    Stores (value, timestamp) under ``_ttl_<name>`` so a burst of property
+    reads reuses one instrument query; setters invalidate by assigning
+    None to that attribute. Use ``math.inf`` for constants.
+    """
+
+    def decorator(fn):
+        attr = f"_ttl_{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(self):
+            hit = getattr(self, attr, None)
+            if hit is not None and time.monotonic() - hit[1] < seconds:
+                return hit[0]
+            val = fn(self)
+            setattr(self, attr, (val, time.monotonic()))
+            return val
+
+        return wrapper
+
+    return decorator
+
+
 @dataclass(frozen=True)
 class R6581TError:
     code: int
@@ -44,14 +72,27 @@ class R6581TInput(Enum):
 R6581T_MAX_DIGITS = 8
 R6581T_MIN_DIGITS = 4
 
+# Per-function SCPI strings assembled once at import; the mode-dependent
+# properties then index a dict instead of interpolating an f-string on
+# every access. The *_W entries are pre-bound str.format methods.
+_RANG_Q = {f: f":{f.value}:RANG?" for f in R6581TFunction}
+_RANG_AUTO_Q = {f: f":{f.value}:RANG:AUTO?" for f in R6581TFunction}
+_DIG_Q = {f: f":{f.value}:DIG?" for f in R6581TFunction}
+_NPLC_Q = {f: f":{f.value}:NPLC?" for f in R6581TFunction}
+_APER_Q = {f: f":{f.value}:APER?" for f in R6581TFunction}
+
+_RANG_W = {f: f":{f.value}:RANG {{:.2E}}".format for f in R6581TFunction}
+_RANG_MAX_W = {f: f":{f.value}:RANG MAX" for f in R6581TFunction}
+_RANG_AUTO_W = {f: f":{f.value}:RANG:AUTO {{}}".format for f in R6581TFunction}
+_DIG_W = {f: f":{f.value}:DIG {{}}.00".format for f in R6581TFunction}
+_NPLC_W = {f: f":{f.value}:NPLC {{:+.5E}}".format for f in R6581TFunction}
+_APER_W = {f: f":{f.value}:APER {{:+.5E}}".format for f in R6581TFunction}
 
-class R6581T:
-    on_off_lut = {True: "ON", False: "OFF"}
-    on_off_inv = {"1": True, "0": False}
 
+class R6581T:
     def __init__(self, ins: InstrumentInterface):
         self.ins = ins
-        self._line_freq: Optional[int] = None
+        self._mode: Optional[R6581TFunction] = None
 
     def _write_data(self, dat: str) -> None:
         self.ins.write(dat)
@@ -62,9 +103,21 @@ class R6581T:
     def _query_data(self, dat: str) -> str:
         return self.ins.query(dat)
 
+    def _query_many(self, cmds: list[str]) -> list[str]:
+        """
+        Issue several queries as one semicolon-compound message.
+
+        The instrument answers with the replies joined by ";", so a burst
+        of related reads costs one GPIB round-trip instead of one each.
+        """
+        return self._query_data(";".join(cmds)).strip().split(";")
+
     def reset(self) -> None:
         self._write_data("*RST")
         self._write_data("*CLS")
+        self._mode = None
+        self._ttl_filter = None
+        self._ttl_filter_en = None
 
     def beep(self):
         """The instrument returns a single beep immediately."""
@@ -74,59 +127,75 @@ class R6581T:
     def beeper(self) -> bool:
         """Switches the front panel control beeper on or off."""
         res = self._query_data("SYST:BEEP:STAT?")
-        return self.on_off_inv[res.strip()]
+        return res.strip() == "1"
 
     @beeper.setter
     def beeper(self, val: bool) -> None:
         """Switches the front panel control beeper on or off."""
-        self._write_data(f"SYST:BEEP:STAT {self.on_off_lut[val]}")
+        self._write_data(f"SYST:BEEP:STAT {'ON' if val else 'OFF'}")
 
     @property
     def data(self) -> float:
         """Reads measurement data from the instrument."""
-        val = self._query_data("READ?")
-        if '"' in val:
-            logger.debug("data Re-Read")
+        for _ in range(3):
             val = self._query_data("READ?")
+            if '"' not in val:
+                break
+            logger.debug("data Re-Read")
+        else:
+            return math.nan
         if val is None:
             return math.nan
-        val_f = float(val.split()[-1])
+        # Only the last token is wanted; rpartition avoids building the
+        # full split list on every reading of a tight measurement loop
+        val_f = float(val.rpartition(" ")[2])
         if val_f == 9.9e37:
             return math.inf
         return val_f
 
     @property
     def mode(self) -> R6581TFunction:
-        return R6581TFunction(self._query_data("CONF?").strip().strip('"').strip())
+        # The mode only changes through the setter or a reset, so the burst
+        # of prefix lookups from range/digits/nplc costs one CONF? total.
+        if self._mode is None:
+            self._mode = R6581TFunction(
+                self._query_data("CONF?").strip().strip('"').strip()
+            )
+        return self._mode
 
     @mode.setter
     def mode(self, val: R6581TFunction) -> None:
         self._write_data(f":CONF:{val.value}")
+        self._mode = val
 
     @property
     def null(self) -> bool:
         """Status of the NULL function"""
         res = self._query_data(":CALC:NULL:STATE?")
-        return self.on_off_inv[res.strip()]
+        return res.strip() == "1"
 
     @null.setter
     def null(self, val: bool) -> None:
         """Status of the NULL function"""
-        self._write_data(f":CALC:NULL:STAT {self.on_off_lut[val]}")
+        self._write_data(f":CALC:NULL:STAT {'ON' if val else 'OFF'}")
 
     @property
     def null_ofst(self) -> float:
         """Readback the null offset (nan if not in null mode)."""
-        if self.null is True:
+        # DATA? is only valid while NULL is on; query the state first so
+        # the disabled path stays a clean nan with no rejected command
+        if self._query_data(":CALC:NULL:STATE?").strip() == "1":
             return float(self._query_data(":CALC:NULL:DATA?"))
         return math.nan
 
     @property
+    @ttl_cached(0.05)
     def filter(self) -> R6581TFilter:
         """Get filter status, R6581TFilter.NONE is not enabled."""
-        if self.filter_en is False:
+        en, raw = self._query_many([":CALC:DFIL:STATE?", ":CALC:DFIL?"])
+        if en.strip() != "1":
             return R6581TFilter.NONE
-        return R6581TFilter(self._query_data(":CALC:DFIL?").strip().strip('"').strip())
+        return R6581TFilter(raw.strip().strip('"').strip())
 
     @filter.setter
     def filter(self, val: Union[R6581TFilter, None]) -> None:
@@ -137,22 +206,29 @@ class R6581T:
             self.filter_en = False
         self._write_data(f":CALC:DFIL {val.value}")
         self.filter_en = True
+        self._ttl_filter = None
 
     @property
+    @ttl_cached(0.05)
     def filter_en(self) -> bool:
         """Filter enable status, changed by R6581T.filter."""
         res = self._query_data(":CALC:DFIL:STATE?")
-        return self.on_off_inv[res.strip()]
+        return res.strip() == "1"
 
     @filter_en.setter
     def filter_en(self, val: bool) -> None:
         """Filter enable status, changed by R6581T.filter."""
-        self._write_data(f":CALC:DFIL:STATE {self.on_off_lut[val]}")
+        self._write_data(f":CALC:DFIL:STATE {'ON' if val else 'OFF'}")
+        self._ttl_filter_en = None
+        self._ttl_filter = None
 
     @property
     def filter_len(self) -> Optional[int]:
         """Filter len; -1 if R6581TFilter.NONE; must set AFTER setting the filter mode."""
-        filt_mode = self.filter
+        en, raw = self._query_many([":CALC:DFIL:STATE?", ":CALC:DFIL?"])
+        if en.strip() != "1":
+            return None
+        filt_mode = R6581TFilter(raw.strip().strip('"').strip())
         if filt_mode is R6581TFilter.NONE:
             return None
         elif filt_mode is R6581TFilter.AVERAGE:
@@ -183,12 +259,12 @@ class R6581T:
     def display(self) -> bool:
         """Display enable status."""
         res = self._query_data(":DISP?")
-        return self.on_off_inv[res.strip()]
+        return res.strip() == "1"
 
     @display.setter
     def display(self, val: bool) -> None:
         """Display enable status."""
-        self._write_data(f":DISP {self.on_off_lut[val]}")
+        self._write_data(f":DISP {'ON' if val else 'OFF'}")
 
     @property
     def guard(self) -> bool:
@@ -222,18 +298,16 @@ class R6581T:
     def error(self) -> Optional[R6581TError]:
         """Pop the latest error from the error stack; None if there are no errors."""
         res = self._query_data("SYST:ERR?").strip()
-        raw_code, val = res.split(",")
-        code = int(raw_code.strip())
-        val = val.strip('"')
-        if code == 0:
+        parsed = parse_scpi_error(res)
+        if parsed is None:
             return None
-        return R6581TError(code=code, text=val, raw_str=res)
+        code, text = parsed
+        return R6581TError(code=code, text=text, raw_str=res)
 
     @property
     def range(self) -> float:
         """Get the range of the system (returned as the maxvalue it can read)."""
-        curr_mode = self.mode
-        return float(self._query_data(f":{curr_mode.value}:RANG?"))
+        return float(self._query_data(_RANG_Q[self.mode]))
 
     @range.setter
     def range(self, val: float) -> None:
@@ -252,9 +326,9 @@ class R6581T:
             raise ValueError("Range must be positive!")
         curr_mode = self.mode
         if math.isinf(val):
-            self._write_data(f":{curr_mode.value}:RANG MAX")
+            self._write_data(_RANG_MAX_W[curr_mode])
         else:
-            self._write_data(f":{curr_mode.value}:RANG {val:.2E}")
+            self._write_data(_RANG_W[curr_mode](val))
         err = self.error
         if err is not None and err.code == -222:
             raise ValueError(f"Range {val} is out of range! ({err.raw_str})")
@@ -262,21 +336,18 @@ class R6581T:
     @property
     def auto_range(self) -> bool:
         """Auto range state."""
-        curr_mode = self.mode
-        res = self._query_data(f":{curr_mode.value}:RANG:AUTO?")
-        return self.on_off_inv[res.strip()]
+        res = self._query_data(_RANG_AUTO_Q[self.mode])
+        return res.strip() == "1"
 
     @auto_range.setter
     def auto_range(self, val: bool) -> None:
         """Auto range state."""
-        curr_mode = self.mode
-        self._write_data(f":{curr_mode.value}:RANG:AUTO {self.on_off_lut[val]}")
+        self._write_data(_RANG_AUTO_W[self.mode]('ON' if val else 'OFF'))
 
     @property
     def digits(self) -> int:
         """Auto range state."""
-        curr_mode = self.mode
-        return int(self._query_data(f":{curr_mode.value}:DIG?").split(".")[0])
+        return int(self._query_data(_DIG_Q[self.mode]).split(".")[0])
 
     @digits.setter
     def digits(self, val: int) -> None:
@@ -284,13 +355,12 @@ class R6581T:
         curr_mode = self.mode
         if not R6581T_MIN_DIGITS <= val <= R6581T_MAX_DIGITS:
             raise ValueError(f"Number of digits must be between 4 and 8 not {val}!")
-        self._write_data(f":{curr_mode.value}:DIG {val}.00")
+        self._write_data(_DIG_W[curr_mode](val))
 
     @property
     def nplc(self) -> float:
         """Number of power line cycles state."""
-        curr_mode = self.mode
-        return float(self._query_data(f":{curr_mode.value}:NPLC?").strip())
+        return float(self._query_data(_NPLC_Q[self.mode]).strip())
 
     @nplc.setter
     def nplc(self, val: float) -> None:
@@ -298,13 +368,12 @@ class R6581T:
         curr_mode = self.mode
         if not 1e-6 * self.line_freq <= val <= 100:
             raise ValueError(f"Number of digits must be between 4 and 8 not {val}!")
-        self._write_data(f":{curr_mode.value}:NPLC {val:+.5E}")
+        self._write_data(_NPLC_W[curr_mode](val))
 
     @property
     def int_time(self) -> float:
         """Integration time state."""
-        curr_mode = self.mode
-        return float(self._query_data(f":{curr_mode.value}:APER?").strip())
+        return float(self._query_data(_APER_Q[self.mode]).strip())
 
     @int_time.setter
     def int_time(self, val: float) -> None:
@@ -312,14 +381,13 @@ class R6581T:
         curr_mode = self.mode
         if not 1e-6 <= val <= (1 / self.line_freq) * 100:
             raise ValueError(f"Integration time must be between 4 and 8 not {val}!")
-        self._write_data(f":{curr_mode.value}:APER {val:+.5E}")
+        self._write_data(_APER_W[curr_mode](val))
 
     @property
+    @ttl_cached(math.inf)
     def line_freq(self) -> int:
         """Get the detected line freq."""
-        if self._line_freq is None:
-            self._line_freq = int(self._query_data(":LFRE?").strip()[:-2])
-        return self._line_freq
+        return int(self._query_data(":LFRE?").strip()[:-2])
 
     @property
     def internal_temp(self) -> float:
@@ -330,22 +398,24 @@ class R6581T:
     def azero(self) -> bool:
         """Status of the auto zero function."""
         res = self._query_data(":ZERO:AUTO?")
-        return self.on_off_inv[res.strip()]
+        return res.strip() == "1"
 
     @azero.setter
     def azero(self, val: bool) -> None:
         """Status of the auto zero function."""
-        self._write_data(f":ZERO:AUTO {self.on_off_lut[val]}")
+        self._write_data(f":ZERO:AUTO {'ON' if val else 'OFF'}")
 
 
 if __name__ == "__main__":
     import pyvisa
     from quantiphy import Quantity  # type: ignore
 
+    from ialib.interfaces.visa_rm import get_resource_manager
+
     logging.basicConfig()
     logger.level = logging.DEBUG
 
-    rm = pyvisa.ResourceManager()
+    rm = get_resource_manager()
     ins_interface = cast(
         pyvisa.resources.MessageBasedResource, rm.open_resource("GPIB0::26::INSTR")
     )
@@ -1,4 +1,38 @@
-from typing import Any, Protocol
+import re
+from typing import Any, Optional, Protocol
+
+# Parses a SYST:ERR? reply (code, quoted text) in a single scan
+_ERR_RE = re.compile(r'^\s*([-+]?\d+)\s*,\s*"?(.*?)"?\s*$')
+
+
+def parse_scpi_error(res: str) -> Optional[tuple[int, str]]:
+    """
+    Parse a SYST:ERR? reply into (code, text); None when the code is 0.
+
+    One shared code path with a pattern compiled at import, so the
+    per-driver error getters stay out of the interpreter's string
+    machinery while polling.
+
+    :raises ValueError: If the reply does not look like an error record
+    """
+    match = _ERR_RE.match(res)
+    if match is None:
+        raise ValueError(f"Malformed error response: {res!r}")
+    code = int(match.group(1))
+    if code == 0:
+        return None
+    return code, match.group(2)
+
+
+def parse_scpi_float(dat: str) -> float:
+    """
+    Parse a scalar ASCII SCPI reply such as ``+1.23456789E-03\\r\\n``.
+
+    Lean fast path for hot measurement loops: a single rstrip over the
+    known terminator characters and a direct float() call, instead of the
+    generic strip/split chains used for structured replies.
+    """
+    return float(dat.rstrip("\r\n\t "))
 
 
 class InstrumentInterface(Protocol):
@@ -10,3 +44,22 @@ class InstrumentInterface(Protocol):
 
     def query(self, data: str) -> str:
         ...
+
+
+class InstrumentBase:
+    """
+    Shared base for drivers wrapping an :class:`InstrumentInterface`.
+
+    Binds the interface's write/read/query methods once as
+    ``_write_data``/``_read_data``/``_query_data``, so every GPIB op
+    skips a passthrough method frame and the drivers stop repeating the
+    same three trivial wrappers.
+    """
+
+    __slots__ = ("ins", "_write_data", "_read_data", "_query_data")
+
+    def __init__(self, ins: InstrumentInterface):
+        self.ins = ins
+        self._write_data = ins.write
+        self._read_data = ins.read
+        self._query_data = ins.query
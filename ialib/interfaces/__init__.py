@@ -1,4 +1,5 @@
 import ialib.interfaces.plx_gpib_ethernet
+import ialib.interfaces.visa_rm
 
 try:
     import ialib.interfaces.ug01_lib
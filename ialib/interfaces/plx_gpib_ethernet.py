@@ -1,7 +1,11 @@
 import time
 import random
+import select
 import socket
 import struct
+import asyncio
+import selectors
+import contextlib
 from typing import List
 
 import netifaces as ni  # type: ignore
@@ -9,12 +13,19 @@ import netifaces as ni  # type: ignore
 __all__ = [
     "PlxGPIBEth",
     "PlxGPIBEthDevice",
+    "PlxBufferedDevice",
+    "PlxGPIBEthPool",
     "plx_discover",
     "plx_get_first",
+    "gather_queries",
 ]
 
 prologix_singleton = dict()
 
+# Last ++addr sent per host; keyed like prologix_singleton since every
+# PlxGPIBEth for a host shares one socket (and so one selected address).
+_selected_addrs: dict = dict()
+
 NETFINDER_SERVER_PORT = 3040
 
 NF_IDENTIFY = 0
@@ -25,9 +36,16 @@ NF_MAGIC = 0x5A
 NF_IP_DYNAMIC = 0
 NF_IP_STATIC = 1
 
-HEADER_FMT = "!2cH6s2x"
+# B (not c) so struct yields ints directly and parsing skips the ord() calls
+HEADER_FMT = "!2BH6s2x"
 IDENTIFY_FMT = HEADER_FMT
-IDENTIFY_REPLY_FMT = "!H6c4s4s4s4s4s4s32s"
+IDENTIFY_REPLY_FMT = "!H6B4s4s4s4s4s4s32s"
+
+# Compiled once so per-packet parsing skips the format-string parse
+_HEADER = struct.Struct(HEADER_FMT)
+_REPLY = struct.Struct(IDENTIFY_REPLY_FMT)
+_HDR_LEN = _HEADER.size
+_REPLY_LEN = _REPLY.size
 
 
 def _parse_identify_reply(msg):
@@ -38,27 +56,25 @@ def _parse_identify_reply(msg):
     :param msg: Message to parse
     :return: dict
     """
-    hdrlen = struct.calcsize(HEADER_FMT)
+    headr = _HEADER.unpack_from(msg, 0)
 
-    headr = struct.unpack(HEADER_FMT, msg[0:hdrlen])
-
-    params = struct.unpack(IDENTIFY_REPLY_FMT, msg[hdrlen:])
+    params = _REPLY.unpack_from(msg, _HDR_LEN)
 
     d = {
-        "magic": ord(headr[0]),
-        "id": ord(headr[1]),
+        "magic": headr[0],
+        "id": headr[1],
         "sequence": headr[2],
-        "eth_addr": "-".join(str(i) for i in headr[3]),
+        "eth_addr": headr[3].hex("-"),
         "uptime_days": params[0],
-        "uptime_hrs": ord(params[1]),
-        "uptime_min": ord(params[2]),
-        "uptime_secs": ord(params[3]),
-        "mode": ord(params[4]),
-        "alert": ord(params[5]),
-        "ip_type": ord(params[6]),
-        "ip_addr": ".".join(str(i) for i in params[7]),
-        "ip_netmask": ".".join(str(i) for i in params[8]),
-        "ip_gw": ".".join(str(i) for i in params[9]),
+        "uptime_hrs": params[1],
+        "uptime_min": params[2],
+        "uptime_secs": params[3],
+        "mode": params[4],
+        "alert": params[5],
+        "ip_type": params[6],
+        "ip_addr": socket.inet_ntoa(params[7]),
+        "ip_netmask": socket.inet_ntoa(params[8]),
+        "ip_gw": socket.inet_ntoa(params[9]),
         "app_ver": ".".join(str(i) for i in params[10]),
         "boot_ver": ".".join(str(i) for i in params[11]),
         "hw_ver": ".".join(str(i) for i in params[12]),
@@ -78,42 +94,48 @@ def plx_discover(timeout: float = 0.5) -> List[dict]:
     """
     devices = dict()
 
-    # Search all the interfaces on this PC
+    # Search all the interfaces on this PC; the ExitStack closes both
+    # sockets as soon as the interface is done (or skipped) instead of
+    # leaking fds until GC on multi-homed machines.
     for iface in ni.interfaces():
-        # Sender socket
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        try:
-            s.bind((ni.ifaddresses(iface)[ni.AF_INET][0]["addr"], 0))
-        except KeyError:
-            # Interface has no assigned IP
-            continue
-
-        # Receiver socket
-        r = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        r.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        r.setblocking(False)
-        r.settimeout(0.100)
-        r.bind(("", s.getsockname()[1]))
-
-        seq = random.randint(1, 65535)
-        msg = struct.pack(
-            HEADER_FMT,
-            bytes([NF_MAGIC]),
-            bytes([NF_IDENTIFY]),
-            seq,
-            b"\xFF\xFF\xFF\xFF\xFF\xFF",
-        )
-
-        s.sendto(msg, ("<broadcast>", NETFINDER_SERVER_PORT))
-        exp = time.time() + timeout
-        while time.time() < exp:
+        with contextlib.ExitStack() as stack:
+            # Sender socket
+            s = stack.enter_context(
+                contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM))
+            )
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
             try:
+                s.bind((ni.ifaddresses(iface)[ni.AF_INET][0]["addr"], 0))
+            except KeyError:
+                # Interface has no assigned IP
+                continue
+
+            # Receiver socket
+            r = stack.enter_context(
+                contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM))
+            )
+            r.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            r.bind(("", s.getsockname()[1]))
+
+            seq = random.randint(1, 65535)
+            msg = _HEADER.pack(
+                NF_MAGIC,
+                NF_IDENTIFY,
+                seq,
+                b"\xFF\xFF\xFF\xFF\xFF\xFF",
+            )
+
+            s.sendto(msg, ("<broadcast>", NETFINDER_SERVER_PORT))
+            # Let the kernel block until a packet lands or the deadline passes
+            # instead of spinning on short recv timeouts.
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                ready, _, _ = select.select([r], [], [], remaining)
+                if not ready:
+                    break
                 reply = r.recv(256)
-                if len(reply) != struct.calcsize(HEADER_FMT) + struct.calcsize(
-                    IDENTIFY_REPLY_FMT
-                ):
+                if len(reply) != _HDR_LEN + _REPLY_LEN:
                     continue
                 d = _parse_identify_reply(reply)
                 if d["magic"] != NF_MAGIC:
@@ -123,8 +145,6 @@ def plx_discover(timeout: float = 0.5) -> List[dict]:
                 if d["sequence"] != seq:
                     continue
                 devices[d["eth_addr"]] = d
-            except socket.timeout:
-                pass
 
     return [v for _, v in devices.items()]
 
@@ -145,6 +165,8 @@ def plx_get_first(timeout=0.5) -> str:
 
 
 class PlxGPIBEthDevice:
+    __slots__ = ("address", "gpib")
+
     def __init__(self, host: str, address: int, timeout: float = 1):
         self.address = address
         self.gpib = PlxGPIBEth(host=host, timeout=timeout)
@@ -166,13 +188,46 @@ class PlxGPIBEthDevice:
         return self.gpib.read(*args)
 
     def query(self, *args, retry_limit=10):
+        """
+        Query with timeout retries bounded by a wall-clock deadline.
+
+        A monotonic deadline of retry_limit adapter timeouts bounds the
+        worst-case blocking regardless of how the individual socket
+        timeouts land.
+        """
         self.gpib.select(self.address)
-        for _ in range(retry_limit - 1):
+        budget = retry_limit * self.gpib.timeout
+        deadline = time.monotonic() + budget
+        while True:
             try:
-                return self.query(*args)
+                return self.gpib.query(*args)
             except socket.timeout:
-                pass
-        return self.gpib.query(*args)
+                if time.monotonic() >= deadline:
+                    raise socket.timeout(
+                        f"No reply from GPIB address {self.address} within {budget:.1f} s"
+                    )
+
+    def query_many(self, cmds: List[str]) -> List[str]:
+        """
+        Run several queries back to back with a single address select.
+
+        Selecting the GPIB address once up front amortizes the ++addr
+        round-trip across the whole batch instead of paying it per query.
+        """
+        self.gpib.select(self.address)
+        return [self.gpib.query(cmd) for cmd in cmds]
+
+    async def query_async(self, cmd: str) -> str:
+        """
+        Awaitable query; the blocking transaction runs in the default executor.
+
+        The adapter sockets stay in blocking mode (they are shared between
+        devices through prologix_singleton), so this wraps :meth:`query`
+        rather than switching the socket over to non-blocking asyncio I/O.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.query, cmd
+        )
 
     def idn(self):
         self.gpib.select(self.address)
@@ -183,6 +238,96 @@ class PlxGPIBEthDevice:
         self.write("*RST")
 
 
+async def gather_queries(
+    devices: List[PlxGPIBEthDevice], cmds: List[str]
+) -> List[str]:
+    """
+    Run cmds[i] on devices[i] concurrently; results in submission order.
+
+    Devices on distinct adapters overlap their instrument think time;
+    devices sharing one adapter socket are chained within a single
+    worker, since Prologix replies cannot interleave on one socket.
+    """
+    if len(cmds) != len(devices):
+        raise ValueError(f"Expected {len(devices)} commands, got {len(cmds)}!")
+    results: List[str] = [""] * len(cmds)
+    groups: dict = {}
+    for i, (dev, cmd) in enumerate(zip(devices, cmds)):
+        groups.setdefault(dev.gpib.socket, []).append((i, dev, cmd))
+
+    def run_group(group):
+        for i, dev, cmd in group:
+            results[i] = dev.query(cmd)
+
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.run_in_executor(None, run_group, g) for g in groups.values())
+    )
+    return results
+
+
+class PlxBufferedDevice(PlxGPIBEthDevice):
+    """
+    PlxGPIBEthDevice variant that reads replies through a line buffer.
+
+    recv() runs in large chunks (default 4 KiB) and replies are split on
+    the newline terminator, so a reply costs one or two syscalls instead
+    of one per recv-sized fragment, and bytes past the terminator are
+    kept for the next read. Drivers take any InstrumentInterface, so
+    callers opt in by constructing this class instead of the base one.
+    """
+
+    __slots__ = ("_rxbuf",)
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self, host: str, address: int, timeout: float = 1):
+        self._rxbuf = b""
+        super().__init__(host=host, address=address, timeout=timeout)
+
+    def _read_line(self) -> str:
+        buf = self._rxbuf
+        while True:
+            term = buf.find(b"\n")
+            if term >= 0:
+                line, self._rxbuf = buf[: term + 1], buf[term + 1 :]
+                return line.decode("ascii", errors="replace")
+            chunk = self.gpib.socket.recv(self.CHUNK_SIZE)
+            if not chunk:
+                # Peer closed mid-line; hand back what arrived
+                self._rxbuf = b""
+                return buf.decode("ascii", errors="replace")
+            buf += chunk
+
+    def read(self, *args):
+        self.gpib.select(self.address)
+        self.gpib._send("++read eoi")
+        return self._read_line()
+
+    def query(self, *args, retry_limit=10):
+        """Same deadline semantics as the base class, buffered receive."""
+        self.gpib.select(self.address)
+        budget = retry_limit * self.gpib.timeout
+        deadline = time.monotonic() + budget
+        while True:
+            try:
+                self.gpib._send_many([args[0], "++read eoi"])
+                return self._read_line()
+            except socket.timeout:
+                if time.monotonic() >= deadline:
+                    raise socket.timeout(
+                        f"No reply from GPIB address {self.address} within {budget:.1f} s"
+                    )
+
+    def query_many(self, cmds: List[str]) -> List[str]:
+        self.gpib.select(self.address)
+        out = []
+        for cmd in cmds:
+            self.gpib._send_many([cmd, "++read eoi"])
+            out.append(self._read_line())
+        return out
+
+
 class PlxGPIBEth:
     PORT = 1234
 
@@ -199,6 +344,9 @@ class PlxGPIBEth:
             self.socket = socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP
             )
+            # GPIB commands are tiny writes; without this Nagle holds them
+            # back waiting for ACKs and every command eats a coalescing delay
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.settimeout(self.timeout)
             self.socket.connect((self.host, self.PORT))
             prologix_singleton[host] = self.socket
@@ -210,10 +358,24 @@ class PlxGPIBEth:
         self._setup()
 
     def close(self) -> None:
+        _selected_addrs.pop(self.host, None)
         self.socket.close()
 
+    def set_timeout(self, timeout: float) -> None:
+        """Update the socket and GPIB read timeouts (same bounds as __init__)."""
+        if not 1e-3 <= timeout <= 3:
+            raise ValueError("Timeout must be >= 1e-3 (1ms) and <= 3 (3s)")
+        self.timeout = timeout
+        self.socket.settimeout(timeout)
+        self._send(f"++read_tmo_ms {int(timeout * 1e3)}")
+
     def select(self, addr: int):
+        # Skip the ++addr round-trip when the adapter is already talking
+        # to this address; select() runs before every device operation.
+        if _selected_addrs.get(self.host) == addr:
+            return
         self._send(f"++addr {addr}")
+        _selected_addrs[self.host] = addr
 
     def write(self, cmd: str) -> None:
         self._send(cmd)
@@ -223,18 +385,31 @@ class PlxGPIBEth:
         return self._recv(num_bytes)
 
     def query(self, cmd, buffer_size=1024 * 1024):
-        self.write(cmd)
-        return self.read(buffer_size)
+        # The command and the ++read eoi that follows it always travel
+        # together, so push them in one send instead of two packets.
+        self._send_many([cmd, "++read eoi"])
+        return self._recv(buffer_size)
 
     def _send(self, value):
-        encoded_value = ("%s\n" % value).encode("ascii")
-        self.socket.send(encoded_value)
+        self.socket.sendall(f"{value}\n".encode("ascii"))
+
+    def _send_many(self, values):
+        """Send several newline-terminated commands in a single write."""
+        encoded = ("\n".join(values) + "\n").encode("ascii")
+        self.socket.sendall(encoded)
 
     def _recv(self, byte_num):
-        value = self.socket.recv(byte_num)
-        return value.decode("ascii")
+        # replace rather than raise on stray non-ASCII bytes from the bus
+        return self.socket.recv(byte_num).decode("ascii", errors="replace")
+
+    def _recv_bytes(self, byte_num):
+        """Raw receive for callers that parse bytes and can skip the decode."""
+        return self.socket.recv(byte_num)
 
     def _setup(self):
+        # Adapter state is being re-programmed; do not trust any cached address
+        _selected_addrs.pop(self.host, None)
+
         # set device to CONTROLLER mode
         self._send("++mode 1")
 
@@ -246,3 +421,65 @@ class PlxGPIBEth:
 
         # do not require CR or LF appended to GPIB data
         self._send("++eos 3")
+
+
+class PlxGPIBEthPool:
+    """
+    Fan a batch of queries out over several Prologix adapters at once.
+
+    Every device's command block is written up front, then replies are
+    collected with a selector as the sockets become readable, so total
+    wall time approaches the slowest adapter instead of the sum of all
+    of them. Devices sharing one adapter socket are serialized, since
+    the Prologix protocol cannot interleave replies on a single socket.
+    """
+
+    def __init__(self, devices: List[PlxGPIBEthDevice]):
+        self.devices = devices
+
+    def query_many(self, cmds: List[str], timeout: float = 3.0) -> List[str]:
+        """
+        Run cmds[i] on devices[i] concurrently; results in submission order.
+
+        :raises socket.timeout: If any reply is still missing at the deadline
+        """
+        if len(cmds) != len(self.devices):
+            raise ValueError(
+                f"Expected {len(self.devices)} commands, got {len(cmds)}!"
+            )
+        # Queue per socket; queries on the same adapter must run one at a time
+        pending: dict = {}
+        for i, (dev, cmd) in enumerate(zip(self.devices, cmds)):
+            pending.setdefault(dev.gpib.socket, []).append((i, dev, cmd))
+
+        results: List[str] = [""] * len(cmds)
+        inflight: dict = {}
+        sel = selectors.DefaultSelector()
+
+        def submit(sock):
+            i, dev, cmd = pending[sock].pop(0)
+            dev.gpib.select(dev.address)
+            dev.gpib._send_many([cmd, "++read eoi"])
+            inflight[sock] = i
+            sel.register(sock, selectors.EVENT_READ)
+
+        try:
+            for sock in list(pending):
+                submit(sock)
+            outstanding = len(cmds)
+            deadline = time.monotonic() + timeout
+            while outstanding and (remaining := deadline - time.monotonic()) > 0:
+                for key, _ in sel.select(remaining):
+                    sock = key.fileobj
+                    sel.unregister(sock)
+                    results[inflight.pop(sock)] = sock.recv(1024 * 1024).decode(
+                        "ascii", errors="replace"
+                    )
+                    outstanding -= 1
+                    if pending[sock]:
+                        submit(sock)
+            if outstanding:
+                raise socket.timeout(f"{outstanding} replies missing at deadline")
+        finally:
+            sel.close()
+        return results
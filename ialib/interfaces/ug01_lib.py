@@ -1,21 +1,53 @@
-import os
 import ctypes
 import pathlib
+from typing import Optional
 
 # Cheat and use a windows only solution, this lib only works on windows
-UG01lib = ctypes.CDLL(
-    str(
-        pathlib.Path(__file__)
-        .parent.joinpath("UG01", "UG01API", "LQUG01_c.dll")
-        .absolute()
-    )
-)
-
-UG01lib.Gwrite.restype = ctypes.c_int
-UG01lib.Gread.restype = ctypes.c_char_p
-UG01lib.Gquery.restype = ctypes.c_char_p
-UG01lib.Gfind.restype = ctypes.c_int
-
-UG01lib.Gread.argtypes = [ctypes.c_int]
-UG01lib.Gwrite.argtypes = [ctypes.c_int, ctypes.c_char_p]
-UG01lib.Gquery.argtypes = [ctypes.c_int, ctypes.c_char_p]
+_DLL_PATH = pathlib.Path(__file__).parent / "UG01" / "UG01API" / "LQUG01_c.dll"
+
+_lib: Optional[ctypes.CDLL] = None
+
+
+def _errcheck(result, func, args):
+    """Raise on negative UG01 return codes instead of failing silently."""
+    if isinstance(result, int) and result < 0:
+        raise OSError(f"{func.__name__} failed with code {result}")
+    return result
+
+
+def _get_lib() -> ctypes.CDLL:
+    """
+    Load LQUG01_c.dll on first use and cache it.
+
+    Deferring the load keeps ``import ialib.interfaces.ug01_lib`` working
+    on machines without the adapter; only actually touching the library
+    pays the DLL load (and raises if it is unavailable).
+    """
+    global _lib
+    if _lib is None:
+        # WinDLL (stdcall) where it exists; CDLL elsewhere so the failure
+        # is the missing DLL, not a missing loader class
+        loader = getattr(ctypes, "WinDLL", ctypes.CDLL)
+        lib = loader(str(_DLL_PATH))
+
+        lib.Gwrite.restype = ctypes.c_int
+        lib.Gread.restype = ctypes.c_char_p
+        lib.Gquery.restype = ctypes.c_char_p
+        lib.Gfind.restype = ctypes.c_int
+
+        lib.Gread.argtypes = [ctypes.c_int]
+        lib.Gwrite.argtypes = [ctypes.c_int, ctypes.c_char_p]
+        lib.Gquery.argtypes = [ctypes.c_int, ctypes.c_char_p]
+
+        lib.Gwrite.errcheck = _errcheck
+        lib.Gfind.errcheck = _errcheck
+        _lib = lib
+    return _lib
+
+
+def __getattr__(name: str):
+    # Keep the old eager module attribute working: ug01_lib.UG01lib still
+    # resolves, it just loads the DLL on first touch now.
+    if name == "UG01lib":
+        return _get_lib()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,23 @@
+import threading
+from typing import Optional
+
+import pyvisa
+
+# Shared VISA resource manager; constructing one costs on the order of
+# seconds, so every driver in the process should reuse a single instance
+# (same idea as prologix_singleton in plx_gpib_ethernet).
+_RM: Optional[pyvisa.ResourceManager] = None
+_RM_LOCK = threading.Lock()
+
+
+def get_resource_manager() -> pyvisa.ResourceManager:
+    """
+    Return the process-wide :class:`pyvisa.ResourceManager`, creating it on
+    first use. Thread safe; subsequent calls are a cheap attribute read.
+    """
+    global _RM
+    if _RM is None:
+        with _RM_LOCK:
+            if _RM is None:
+                _RM = pyvisa.ResourceManager()
+    return _RM
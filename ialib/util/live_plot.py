@@ -5,7 +5,6 @@ import matplotlib.animation as animation
 from scipy import stats
 from quantiphy import Quantity
 from matplotlib import style
-from scipy.stats import norm
 
 style.use("seaborn")
 
@@ -13,38 +12,69 @@ fig = plt.figure()
 ax1 = fig.add_subplot(1, 1, 1)
 
 
-def animate(i):
-    try:
-        file = open("dat.txt", "r")
-        graph_data = file.read()
-        lines = graph_data.split("\n")
-        file.close()
-        xs = []
-        ys = []
-        for line in lines:
-            if len(line) > 1 and not line.startswith("#"):
-                x, y = [float(f) for f in line.split(",")]
-                xs.append(x)
-                ys.append(y)
-        ax1.clear()
-
-        mu, std = norm.fit(ys)
-
-        # Plot the histogram.
-        # ax1.hist(ys, density=True, alpha=0.6, color='g')
-        plt.scatter(xs, ys)
-        # Plot the PDF.
-        xmin, xmax = plt.xlim()
-        x = np.linspace(xmin, xmax, 100)
-        p = norm.pdf(x, mu, std)
-        # ax1.plot(x, p, 'k', linewidth=2)
-        k2, p = stats.normaltest(ys)
-        title = f"Fit results: mu = {Quantity(mu, 'Ohm')},  std = {Quantity(std, 'Ohm')}, p = {p:.3f} (normal if p > 0.05)"
-        plt.title(title)
-    except Exception as e:
-        print(e)
-
-
-animate(None)
-ani = animation.FuncAnimation(fig, animate, interval=100)
+class LivePlot:
+    """
+    Incrementally tail the data file and update the scatter in place.
+
+    Re-reading and re-parsing the whole file every 100 ms tick makes a
+    long run O(N^2); keeping the file handle open and parsing only the
+    newly appended lines keeps per-frame work proportional to new data.
+    The scatter artist is likewise created once and updated with
+    set_offsets instead of a clear() + re-plot each frame.
+    """
+
+    def __init__(self, path="dat.txt"):
+        self.path = path
+        self.xs = []
+        self.ys = []
+        self._fp = None
+        self._partial = ""
+        # Persistent artists so blitting can redraw just these two
+        # instead of rasterizing the whole figure each frame
+        self.scat = ax1.scatter([], [])
+        self.title = ax1.set_title("")
+
+    def _read_new(self):
+        if self._fp is None:
+            self._fp = open(self.path, "r")
+        lines = (self._partial + self._fp.read()).split("\n")
+        # Last element is empty or a line the writer has not finished yet;
+        # hold it back and prepend it to the next read.
+        self._partial = lines.pop()
+        new = [line for line in lines if len(line) > 1 and not line.startswith("#")]
+        if new:
+            # One C-level parse of the whole new chunk instead of a
+            # Python float() loop per field; each line is already "x,y"
+            # so a comma join keeps a single separator throughout
+            dat = np.fromstring(",".join(new), sep=",")
+            if dat.size % 2:
+                # Malformed chunk; skip it rather than mis-pair columns
+                return
+            dat = dat.reshape(-1, 2)
+            self.xs.extend(dat[:, 0])
+            self.ys.extend(dat[:, 1])
+
+    def animate(self, i):
+        try:
+            self._read_new()
+
+            ys = np.asarray(self.ys)
+            # Equivalent to norm.fit(ys) (MLE mean/std) without the
+            # scipy fitting machinery per frame
+            mu, std = ys.mean(), ys.std()
+
+            self.scat.set_offsets(np.c_[self.xs, self.ys])
+            ax1.update_datalim(self.scat.get_offsets())
+            ax1.autoscale_view()
+            _k2, pval = stats.normaltest(self.ys)
+            title = f"Fit results: mu = {Quantity(mu, 'Ohm')},  std = {Quantity(std, 'Ohm')}, p = {pval:.3f} (normal if p > 0.05)"
+            self.title.set_text(title)
+        except Exception as e:
+            print(e)
+        return self.scat, self.title
+
+
+plot = LivePlot()
+plot.animate(None)
+ani = animation.FuncAnimation(fig, plot.animate, interval=100, blit=True)
 plt.show()